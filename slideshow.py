@@ -7,11 +7,58 @@ Recursively finds and displays images from nested folders
 import os
 import sys
 from pathlib import Path
-from tkinter import Tk, Label, Canvas
-from PIL import Image, ImageTk
 import argparse
+import hashlib
 import json
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; it reads and writes the state file several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tkinter and Pillow are imported by import_gui_modules(), so --help and
+# argument errors exit without loading them
+Tk = Label = None
+ExifTags = Image = ImageOps = ImageTk = None
+
+
+# Resampling filters selectable with --filter (Image.Resampling member names)
+RESAMPLE_FILTERS = {
+    'lanczos': 'LANCZOS',
+    'bicubic': 'BICUBIC',
+    'bilinear': 'BILINEAR',
+    'box': 'BOX',
+}
+
+# Resampling filter used for each --quality preset
+QUALITY_FILTERS = {
+    'fast': 'bilinear',
+    'high': 'lanczos',
+}
+
+# Application files live next to the script; built once at import
+SCRIPT_DIR = Path(__file__).parent
+STATE_FILE = SCRIPT_DIR / "slideshow_state.json"
+CACHE_DIR = SCRIPT_DIR / "slideshow_cache"
+IGNORE_FILE = SCRIPT_DIR / "ignore.json"
+
+# Number of directories whose image lists are kept in the cache
+IMAGE_CACHE_MAX_FILES = 50
+
+
+def import_gui_modules():
+    """
+    Import Tkinter and Pillow into the module namespace.
+    Deferred until a slideshow is created, as they dominate startup time.
+    """
+    global Tk, Label, ExifTags, Image, ImageOps, ImageTk
+    from tkinter import Tk, Label
+    from PIL import ExifTags, Image, ImageOps, ImageTk
 
 
 def get_state_file_path():
@@ -19,7 +66,7 @@ def get_state_file_path():
     Returns the Path object for the state file.
     Uses script directory to ensure state file is with the application.
     """
-    return Path(__file__).parent / "slideshow_state.json"
+    return STATE_FILE
 
 
 def normalize_directory_path(path):
@@ -35,6 +82,37 @@ def normalize_directory_path(path):
     return str(Path(path).resolve())
 
 
+def read_json_file(path):
+    """
+    Read and parse a JSON file, using orjson when available.
+
+    Args:
+        path: Path object of the file
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(path, data):
+    """
+    Write data as compact JSON (the file is machine-read), using orjson when available.
+
+    Args:
+        path: Path object of the file
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+
 def load_state():
     """
     Load the slideshow state from JSON file.
@@ -48,8 +126,7 @@ def load_state():
         return {"version": "1.0", "directories": {}}
 
     try:
-        with open(state_file, 'r', encoding='utf-8') as f:
-            state = json.load(f)
+        state = read_json_file(state_file)
 
         # Validate structure
         if not isinstance(state, dict) or 'directories' not in state:
@@ -81,8 +158,7 @@ def save_state(state):
 
     try:
         # Write to temp file first
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        write_json_file(temp_file, state)
 
         # Atomic rename
         temp_file.replace(state_file)
@@ -93,12 +169,117 @@ def save_state(state):
             temp_file.unlink()
 
 
+def get_cache_dir_path():
+    """
+    Returns the Path object for the image list cache directory.
+    Uses script directory to ensure the cache is with the application.
+    """
+    return CACHE_DIR
+
+
+def get_image_cache_path(dir_key):
+    """
+    Returns the Path object for a directory's image list cache file.
+
+    Args:
+        dir_key: Normalized directory path (see normalize_directory_path)
+    """
+    digest = hashlib.sha1(dir_key.encode('utf-8')).hexdigest()
+    return get_cache_dir_path() / f"{digest}.json"
+
+
+def load_image_cache(dir_key, disable_ignore):
+    """
+    Load the image list cached by a previous scan of a directory.
+
+    Args:
+        dir_key: Normalized directory path
+        disable_ignore: Whether folder ignore filtering is disabled for this run
+
+    Returns:
+        list: Sorted relative image paths, or None if no usable cache exists
+    """
+    cache_file = get_image_cache_path(dir_key)
+
+    if not cache_file.exists():
+        return None
+
+    try:
+        data = read_json_file(cache_file)
+
+        # Only use a cache made for the same directory and filtering mode
+        if (not isinstance(data, dict)
+                or data.get('directory') != dir_key
+                or data.get('no_ignore') != disable_ignore
+                or not isinstance(data.get('images'), list)):
+            return None
+
+        return data['images']
+
+    except Exception as e:
+        print(f"Warning: Error loading image list cache ({e})")
+        return None
+
+
+def save_image_cache(dir_key, disable_ignore, relative_paths):
+    """
+    Save a directory's scanned image list for faster startup with --continue.
+
+    Args:
+        dir_key: Normalized directory path
+        disable_ignore: Whether folder ignore filtering was disabled for the scan
+        relative_paths: Sorted relative image paths
+    """
+    cache_file = get_image_cache_path(dir_key)
+    temp_file = cache_file.with_suffix('.tmp')
+
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+
+        # Write to temp file first
+        write_json_file(temp_file, {
+            'directory': dir_key,
+            'no_ignore': disable_ignore,
+            'images': relative_paths
+        })
+
+        # Atomic rename
+        temp_file.replace(cache_file)
+
+    except Exception as e:
+        print(f"Warning: Could not save image list cache ({e})")
+        if temp_file.exists():
+            temp_file.unlink()
+        return
+
+    prune_image_cache()
+
+
+def prune_image_cache(max_files=IMAGE_CACHE_MAX_FILES):
+    """
+    Delete the least recently written image list caches beyond max_files.
+
+    Args:
+        max_files: Number of cache files to keep
+    """
+    try:
+        cache_files = sorted(
+            get_cache_dir_path().glob('*.json'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        for cache_file in cache_files[max_files:]:
+            cache_file.unlink()
+    except OSError as e:
+        print(f"Warning: Could not prune image list cache ({e})")
+
+
 def get_ignore_file_path():
     """
     Returns the Path object for the ignore file.
     Uses script directory to ensure ignore file is with the application.
     """
-    return Path(__file__).parent / "ignore.json"
+    return IGNORE_FILE
 
 
 def load_ignore_list():
@@ -120,6 +301,7 @@ def load_ignore_list():
             ]
         }
         try:
+            # Indented, unlike the state file: users edit this one by hand
             with open(ignore_file, 'w', encoding='utf-8') as f:
                 json.dump(default_ignore, f, indent=2, ensure_ascii=False)
             print(f"Created ignore.json with default folders: PREVIEW, THUMBNAIL")
@@ -129,8 +311,7 @@ def load_ignore_list():
 
     # Load the ignore list
     try:
-        with open(ignore_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json_file(ignore_file)
 
         # Validate structure
         if not isinstance(data, dict) or 'ignore_folders' not in data:
@@ -170,21 +351,121 @@ def should_ignore_path(image_path, ignore_set):
     Check if any parent folder in path matches ignore list.
 
     Args:
-        image_path: Path object to check
+        image_path: Path string to check
         ignore_set: Set of folder names to ignore
 
     Returns:
         bool: True if path should be ignored
     """
     # Check if any part of the path matches an ignored folder
-    for part in image_path.parts:
+    for part in image_path.split(os.sep):
         if part in ignore_set:
             return True
     return False
 
 
+# Minimum number of top-level subfolders before scan_tree walks them in parallel
+PARALLEL_SCAN_MIN_FOLDERS = 4
+
+
+def list_dir_sorted(path):
+    """
+    List a directory's entries sorted by name.
+    Walking depth-first in this order yields paths in the same order as
+    sorting them as Path objects (component by component).
+
+    Args:
+        path: Directory path string
+
+    Returns:
+        list: os.DirEntry objects (empty if the directory can't be read)
+    """
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda e: e.name)
+    except PermissionError:
+        print(f"Warning: Cannot read {path} (permission denied), skipping")
+        return []
+
+
+def scan_tree(root, extensions, ignore_set=frozenset(), skipped=None, parallel=True, stop=None):
+    """
+    Walk a directory tree once, yielding matching files in sorted path order.
+    Uses an explicit stack of directory iterators rather than recursion.
+    Directories named in ignore_set are pruned without being opened.
+
+    When the root has more than PARALLEL_SCAN_MIN_FOLDERS subfolders, all
+    but the first are walked on a thread pool (os.scandir releases the GIL,
+    which helps most on network drives); results are still yielded in order.
+
+    Args:
+        root: Root directory path string
+        extensions: Tuple of extensions to match, case-sensitive (e.g. ('.jpg', '.JPG'))
+        ignore_set: Set of folder names to skip
+        skipped: Optional list that paths of skipped folders are appended to
+        parallel: Whether top-level subfolders may be walked concurrently
+        stop: Optional threading.Event; once set, the walk (including any
+            parallel subfolder walks) ends early
+
+    Yields:
+        str: Path of each matching file
+    """
+    # Queued parallel walks may only start after a stop
+    if stop is not None and stop.is_set():
+        return
+
+    root_entries = list_dir_sorted(root)
+
+    # Top-level subfolder path -> future of its list of matching files
+    subtrees = {}
+    pool = None
+    subdirs = [
+        entry.path for entry in root_entries
+        if entry.is_dir(follow_symlinks=False) and entry.name not in ignore_set
+    ]
+    if parallel and len(subdirs) > PARALLEL_SCAN_MIN_FOLDERS:
+        pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        # The first subfolder is walked inline so its images stream out
+        # right away; the rest are walked meanwhile
+        for path in subdirs[1:]:
+            subtrees[path] = pool.submit(
+                list, scan_tree(path, extensions, ignore_set, skipped, parallel=False, stop=stop)
+            )
+
+    stack = [iter(root_entries)]
+
+    try:
+        while stack:
+            if stop is not None and stop.is_set():
+                return
+
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            # DirEntry caches type info from readdir, so no extra stat
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in ignore_set:
+                    if skipped is not None:
+                        skipped.append(entry.path)
+                    continue
+                if len(stack) == 1 and entry.path in subtrees:
+                    yield from subtrees[entry.path].result()
+                else:
+                    stack.append(iter(list_dir_sorted(entry.path)))
+            elif entry.is_file() and entry.name.endswith(extensions):
+                yield entry.path
+    finally:
+        # Pool threads are joined at interpreter exit, so drop walks that
+        # haven't started; running ones end at their next stop check
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
 class ImageSlideshow:
-    def __init__(self, root_dir, fullscreen=False, delay=3000, resume=False, disable_ignore=False, start_index=None):
+    def __init__(self, root_dir, fullscreen=False, delay=3000, resume=False, disable_ignore=False, start_index=None,
+                 resample_filter='bicubic'):
         """
         Initialize the slideshow
 
@@ -195,22 +476,73 @@ class ImageSlideshow:
             resume: Whether to resume from last viewed image
             disable_ignore: Whether to disable folder ignore filtering
             start_index: Optional starting image index (0-based, overrides resume)
+            resample_filter: Resampling filter name for resizing (see RESAMPLE_FILTERS)
         """
+        import_gui_modules()
+
         self.root_dir = Path(root_dir)
         self.fullscreen = fullscreen
         self.delay = delay
         self.auto_play = delay > 0
         self.timer_id = None
+        self.next_deadline = 0.0
         self.resize_timer_id = None
+        self.last_size = (0, 0)
+        # Size the current image was last displayed at
+        self.display_size = (0, 0)
+        # Display size locked in once fullscreen has settled
+        self.fixed_size = None
         self.disable_ignore = disable_ignore
+        self.resample = Image.Resampling[RESAMPLE_FILTERS[resample_filter]]
 
         # Supported image extensions
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif'}
+        # Lower and upper case forms for str.endswith(), which checks all
+        # suffixes in one C call without lowercasing each file name
+        self.extension_tuple = tuple(
+            variant for ext in self.image_extensions for variant in (ext, ext.upper())
+        )
+
+        # Image lists, filled in by the background scan (see find_images)
+        self.image_paths = []
+        self.relative_paths = []
+        self.relative_index = {}
+        self.first_image_found = threading.Event()
+        self.scan_complete = threading.Event()
+
+        # Result of the re-scan run when starting from the cached image list
+        self.rescan_done = threading.Event()
+        self.rescan_result = None
+
+        # Set on quit to stop any scan still running
+        self.scan_stop = threading.Event()
+
+        # Load saved state once; kept in memory and written back on quit
+        self.state = load_state()
+        self.dir_key = normalize_directory_path(self.root_dir)
+
+        # Resume can start from the image list cached by the last scan
+        self.cached_image_list = None
+        if resume and start_index is None:
+            self.cached_image_list = load_image_cache(self.dir_key, disable_ignore)
 
-        # Find all images
         print(f"Searching for images in {self.root_dir}...")
-        self.image_paths = self.find_images()
-        print(f"Found {len(self.image_paths)} images")
+
+        if self.cached_image_list:
+            # Start right away; a background scan picks up changes (see check_rescan)
+            print(f"Using cached list of {len(self.cached_image_list)} images")
+            self.set_image_list(self.cached_image_list)
+            threading.Thread(target=self.scan_images, args=(False,), daemon=True).start()
+        else:
+            # Find all images in the background; the slideshow can start as soon
+            # as the first one is found, since images are found in sorted order
+            threading.Thread(target=self.scan_images, args=(True,), daemon=True).start()
+
+            if start_index is not None or resume:
+                # Start position is relative to the full list
+                self.scan_complete.wait()
+            else:
+                self.first_image_found.wait()
 
         if not self.image_paths:
             print("No images found!")
@@ -228,8 +560,7 @@ class ImageSlideshow:
                 self.current_index = 0
         elif resume:
             # Handle resume functionality
-            state = load_state()
-            self.current_index = self.get_resume_index(state)
+            self.current_index = self.get_resume_index()
             if self.current_index > 0:
                 print(f"Resuming from image {self.current_index + 1}/{len(self.image_paths)}")
         else:
@@ -238,6 +569,38 @@ class ImageSlideshow:
         # Track rotation angle for current image (in degrees)
         self.current_rotation = 0
 
+        # Tk image shown in the label, reused between frames
+        self.photo = None
+
+        # Worker threads for image decoding (PIL releases the GIL while decoding)
+        self.decode_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        # Previews get their own thread so they never queue behind full decodes
+        self.preview_pool = ThreadPoolExecutor(max_workers=1)
+        self.render_generation = 0
+
+        # (index, rotation, width, height) of the requested and the displayed image
+        self.pending_render = None
+        self.last_render = None
+        # Resized image currently on screen, reused when only the rotation changes
+        self.current_thumb = None
+
+        # Number of upcoming images decoded in parallel while one is shown
+        # (the previous image is prefetched as well)
+        self.prefetch_count = 2
+
+        # Small LRU of decode futures keyed by (path, rotation, width, height),
+        # holding the previous, current and prefetched next images
+        self.decode_cache = OrderedDict()
+        self.decode_cache_size = self.prefetch_count + 2
+
+        # Decoded (reduced) source of the image decoded for display, keyed by
+        # path and reused when only the window size or rotation changes.
+        # Prefetches don't keep theirs: a large source can be tens of MB and
+        # decode_cache already holds their result. Shared by worker threads,
+        # hence the lock.
+        self.source_cache = {}
+        self.source_lock = threading.Lock()
+
         # Setup GUI
         self.root = Tk()
         self.root.title("Image Slideshow")
@@ -249,11 +612,7 @@ class ImageSlideshow:
         
         self.root.configure(bg='black')
 
-        # Create label for image display
-        self.image_label = Label(self.root, bg='black')
-        self.image_label.pack(fill='both', expand=True)
-
-        # Create label for image info
+        # Create label for image info (packed first so it keeps its space)
         self.info_label = Label(
             self.root,
             text="Loading...",
@@ -263,57 +622,158 @@ class ImageSlideshow:
             pady=5
         )
         self.info_label.pack(side='bottom', fill='x')
+
+        # Create label for image display. Without border or padding, a frame
+        # padded to the label's size requests exactly that size, so showing
+        # it can't grow the label and trigger another resize.
+        self.image_label = Label(self.root, bg='black', bd=0, highlightthickness=0, padx=0, pady=0)
+        self.image_label.pack(fill='both', expand=True)
         
-        # Bind keyboard events
-        self.root.bind('<Escape>', lambda e: self.quit())
-        self.root.bind('q', lambda e: self.quit_without_saving())
-        self.root.bind('<Right>', lambda e: self.next_image())
-        self.root.bind('<Left>', lambda e: self.previous_image())
-        self.root.bind('<space>', lambda e: self.toggle_auto_play())
-        self.root.bind('f', lambda e: self.toggle_fullscreen())
+        # Bind keyboard events (handlers take the event as an optional argument)
+        self.root.bind('<Escape>', self.quit)
+        self.root.bind('q', self.quit_without_saving)
+        self.root.bind('<Right>', self.next_image)
+        self.root.bind('<Left>', self.previous_image)
+        self.root.bind('<space>', self.toggle_auto_play)
+        self.root.bind('f', self.toggle_fullscreen)
         self.root.bind('<Configure>', self.on_resize)
 
-        # Bind rotation keys
-        self.root.bind(',', lambda e: self.rotate_image(-90))  # Counter-clockwise
-        self.root.bind('.', lambda e: self.rotate_image(90))   # Clockwise
-
-        # Bind number keys for delay adjustment
-        for i in range(10):
-            self.root.bind(str(i), lambda e, seconds=i: self.set_delay(seconds))
+        # Rotation (, and .) and delay (0-9) keys share one handler
+        self.root.bind('<Key>', self.on_key)
     
-    def find_images(self):
-        """Recursively find all image files, excluding ignored folders"""
+    def scan_images(self, publish):
+        """
+        Scan for images, then refresh the image list cache if it changed.
+        Runs on a background thread.
+
+        Args:
+            publish: Whether the slideshow uses the lists while they are being
+                filled; otherwise the result is left for check_rescan()
+        """
+        result = self.find_images(publish)
+        relative_paths = result[1]
+
+        # Stopped on quit: the list is incomplete
+        if self.scan_stop.is_set():
+            return
+
+        # Compare with the list on disk when not started from it, so an
+        # unchanged list isn't rewritten on every run
+        previous_list = self.cached_image_list
+        if previous_list is None:
+            previous_list = load_image_cache(self.dir_key, self.disable_ignore)
+
+        if relative_paths != previous_list:
+            save_image_cache(self.dir_key, self.disable_ignore, relative_paths)
+
+        if not publish:
+            self.rescan_result = result
+            self.rescan_done.set()
+
+    def find_images(self, publish=True):
+        """
+        Recursively find all image files, excluding ignored folders.
+        Images are found in sorted order.
+
+        Args:
+            publish: Whether to share the lists with the slideshow as they
+                grow, so it can start before the walk finishes
+
+        Returns:
+            tuple: (image_paths, relative_paths, relative_index)
+        """
+        image_paths = []
+        relative_paths = []
+        relative_index = {}
+
+        if publish:
+            self.image_paths = image_paths
+            self.relative_paths = relative_paths
+            self.relative_index = relative_index
+
         # Load ignore list (unless disabled)
         if not self.disable_ignore:
             ignore_folders = load_ignore_list()
         else:
             ignore_folders = set()
 
-        image_paths = []
-        filtered_count = 0
+        # Paths relative to root_dir, for display and state (parallel to image_paths).
+        # Scanned paths start with root_dir exactly as given (not resolved),
+        # so slicing off that prefix is equivalent to Path.relative_to().
+        root_len = len(os.path.join(str(self.root_dir), ''))
+        skipped_folders = []
 
-        for ext in self.image_extensions:
-            # Collect all candidates
-            candidates = list(self.root_dir.rglob(f'*{ext}'))
-            candidates.extend(self.root_dir.rglob(f'*{ext.upper()}'))
+        try:
+            # Root itself inside an ignored folder: nothing to show
+            if should_ignore_path(str(self.root_dir), ignore_folders):
+                print(f"Note: {self.root_dir} is inside an ignored folder")
+                return image_paths, relative_paths, relative_index
+
+            # Single pass over the tree; ignored folders are never opened
+            for path in scan_tree(str(self.root_dir), self.extension_tuple, ignore_folders, skipped_folders,
+                                  stop=self.scan_stop):
+                # image_paths is appended last: the Tk thread only reads
+                # indices below len(image_paths)
+                relative_path = path[root_len:]
+                relative_index[relative_path] = len(relative_paths)
+                relative_paths.append(relative_path)
+                image_paths.append(path)
+                if publish:
+                    self.first_image_found.set()
+        finally:
+            if skipped_folders:
+                print(f"Skipped {len(skipped_folders)} ignored folder(s)")
+            print(f"Found {len(image_paths)} images")
+
+            if publish:
+                self.scan_complete.set()
+                # Unblock startup if nothing was found
+                self.first_image_found.set()
+
+        return image_paths, relative_paths, relative_index
+
+    def set_image_list(self, relative_paths):
+        """
+        Use a complete, sorted list of relative image paths (e.g. from the cache).
 
-            # Filter out ignored paths
-            for path in candidates:
-                if not should_ignore_path(path, ignore_folders):
-                    image_paths.append(path)
-                else:
-                    filtered_count += 1
+        Args:
+            relative_paths: Sorted image paths relative to root_dir
+        """
+        root = str(self.root_dir)
+        self.relative_paths = relative_paths
+        self.relative_index = {rel: i for i, rel in enumerate(relative_paths)}
+        self.image_paths = [os.path.join(root, rel) for rel in relative_paths]
+        self.scan_complete.set()
+        self.first_image_found.set()
+
+    def check_rescan(self):
+        """
+        Swap in the background re-scan result if it differs from the cached
+        list, keeping the current image. Runs on the Tk thread.
+        """
+        if not self.rescan_done.is_set():
+            self.root.after(500, self.check_rescan)
+            return
 
-        # Sort and report
-        image_paths.sort()
+        image_paths, relative_paths, relative_index = self.rescan_result
+        if not image_paths or relative_paths == self.relative_paths:
+            return
 
-        if filtered_count > 0:
-            print(f"Filtered {filtered_count} images in ignored folders")
+        print(f"Image list changed since last run, now {len(image_paths)} images")
+        current_path = self.relative_paths[self.current_index]
+
+        self.image_paths = image_paths
+        self.relative_paths = relative_paths
+        self.relative_index = relative_index
+        self.current_index = relative_index.get(current_path, min(self.current_index, len(image_paths) - 1))
+
+        # Cached decodes are keyed by path and stay valid; the displayed
+        # render is keyed by index, which may now refer to another image
+        self.last_render = None
+        self.display_image()
 
-        return image_paths
-    
     def display_image(self):
-        """Display the current image"""
+        """Display the current image (decoded on a background thread)"""
         if not self.image_paths:
             return
 
@@ -322,17 +782,14 @@ class ImageSlideshow:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
 
-        image_path = self.image_paths[self.current_index]
-
-        try:
-            # Load and display image
-            img = Image.open(image_path)
-
-            # Apply rotation if needed
-            if self.current_rotation != 0:
-                img = img.rotate(-self.current_rotation, expand=True)
+        # Auto-play delay counts from now, not from when decoding finishes
+        self.next_deadline = time.monotonic() + self.delay / 1000
 
-            # Get window size
+        if self.fixed_size is not None:
+            # Settled fullscreen window, size can't change
+            window_width, window_height = self.fixed_size
+        else:
+            # Get window size (Tk calls must stay on the main thread)
             window_width = self.image_label.winfo_width()
             window_height = self.image_label.winfo_height()
 
@@ -342,43 +799,372 @@ class ImageSlideshow:
             if window_height <= 1:
                 window_height = 768 - 40  # Account for info label
 
-            # Resize image to fit window while maintaining aspect ratio
-            img.thumbnail((window_width, window_height), Image.Resampling.LANCZOS)
+        if (window_width, window_height) != self.display_size:
+            # Cached decodes were sized for the old window
+            self.decode_cache.clear()
+        self.display_size = (window_width, window_height)
 
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(img)
+        # A newer request supersedes any decode still in flight
+        self.render_generation += 1
 
-            # Display image in label
-            self.image_label.config(image=self.photo)
+        # Already showing this image at this size: only refresh status and timer
+        self.pending_render = (self.current_index, self.current_rotation, window_width, window_height)
+        if self.pending_render == self.last_render:
+            self._update_status()
+            return
 
-            # Update info label
-            relative_path = image_path.relative_to(self.root_dir)
-            delay_seconds = self.delay // 1000
-            status = f"▶ AUTO ({delay_seconds}s)" if self.auto_play else f"⏸ MANUAL ({delay_seconds}s)"
-            self.info_label.config(
-                text=f"{status} | {self.current_index + 1}/{len(self.image_paths)} | {relative_path}"
+        # Only the rotation changed: rotate the resized image already in memory
+        rotated = self._rotate_current_thumb()
+        if rotated is not None:
+            self._present_image(rotated)
+            return
+
+        # Decode off the Tk thread (or reuse a prefetch)
+        future = self._request_decode(*self.pending_render, keep_source=True)
+
+        # If the full decode isn't ready, show a quick low-res preview meanwhile
+        preview = None
+        image_path = self.image_paths[self.current_index]
+        if not future.done() and image_path not in self.source_cache:
+            preview = self.preview_pool.submit(
+                self._decode_preview, image_path, *self.pending_render[1:]
             )
 
-            # Force GUI update
-            self.root.update_idletasks()
+        self.root.after(10, self._poll_decode, future, self.render_generation, preview)
+
+    def _rotate_current_thumb(self):
+        """
+        Rotate the image on screen to the requested rotation without decoding it again.
+
+        Returns:
+            PIL image for the pending render, or None if it has to be decoded
+            (different image or size, or the result would be smaller than a
+            fresh decode, e.g. turning a shrunk portrait back to landscape)
+        """
+        if (self.last_render is None or self.current_thumb is None
+                or self.last_render[0] != self.pending_render[0]
+                or self.last_render[2:] != self.pending_render[2:]):
+            return None
+
+        window_width, window_height = self.display_size
+        degrees = (self.pending_render[1] - self.last_render[1]) % 360
+        img = self.current_thumb.rotate(-degrees, expand=True)
+
+        if img.width > window_width or img.height > window_height:
+            # Shrinking keeps it as large as a fresh decode would be
+            img.thumbnail((window_width, window_height), self.resample)
+        elif img.width != window_width and img.height != window_height:
+            # A fresh decode could fill more of the window
+            return None
+
+        return img
+
+    def _request_decode(self, index, rotation, window_width, window_height, keep_source=False):
+        """
+        Get the decode future for an image, submitting it if not already cached.
+
+        Args:
+            index: Index of the image to decode
+            rotation: Rotation angle in degrees (clockwise)
+            window_width: Target width in pixels
+            window_height: Target height in pixels
+            keep_source: Whether a new decode keeps its source in source_cache
+
+        Returns:
+            Future: Future resolving to the resized PIL image
+        """
+        # Keyed by path, so entries stay valid if the image list is swapped
+        key = (self.image_paths[index], rotation, window_width, window_height)
+        future = self.decode_cache.get(key)
+
+        if future is None:
+            future = self.decode_pool.submit(self._decode_image, *key, keep_source)
+            self.decode_cache[key] = future
+            # Evict least recently used entries
+            while len(self.decode_cache) > self.decode_cache_size:
+                self.decode_cache.popitem(last=False)
+        else:
+            self.decode_cache.move_to_end(key)
+
+        return future
+
+    def _decode_image(self, image_path, rotation, window_width, window_height, keep_source=False):
+        """
+        Load, rotate and resize an image. Runs on a worker thread.
+
+        Args:
+            image_path: Path string of the image to decode
+            rotation: Rotation angle in degrees (clockwise)
+            window_width: Target width in pixels
+            window_height: Target height in pixels
+            keep_source: Whether to keep the decoded source in source_cache
+
+        Returns:
+            Image: PIL image resized to fit the target size
+        """
+        # Target size before rotation
+        if rotation in (90, 270):
+            target_width, target_height = window_height, window_width
+        else:
+            target_width, target_height = window_width, window_height
+
+        img = self._open_source(image_path, target_width, target_height, keep_source)
+
+        # Apply rotation if needed
+        if rotation != 0:
+            img = img.rotate(-rotation, expand=True)
+        elif img.width <= window_width and img.height <= window_height:
+            # Already fits, no resize needed (the source is only read from here on)
+            return img
+        else:
+            # thumbnail() resizes in place, so keep the cached source intact
+            img = img.copy()
+
+        # Resize image to fit window while maintaining aspect ratio
+        img.thumbnail((window_width, window_height), self.resample)
+        return img
+
+    def _open_source(self, image_path, target_width, target_height, keep_source=False):
+        """
+        Decode an image at a reduced size suitable for the target size.
+        Reuses a cached source when it is still large enough, so resizing
+        the window does not decode the file again. Runs on a worker thread.
+
+        Args:
+            image_path: Path string of the image to decode
+            target_width: Target width in pixels (before rotation)
+            target_height: Target height in pixels (before rotation)
+            keep_source: Whether to cache the decoded source, replacing the
+                one cached before
+
+        Returns:
+            Image: Loaded PIL image, shared with the cache (do not modify)
+        """
+        with self.source_lock:
+            cached = self.source_cache.get(image_path)
+
+        if cached is not None:
+            img, native_size = cached
+            # Usable if not reduced, or still at least 2x the new target
+            if img.size == native_size or max(img.width / target_width, img.height / target_height) >= 2:
+                return img
+
+        # PIL accepts path strings directly
+        img = Image.open(image_path)
+        native_size = img.size
+
+        # Images stored sideways (EXIF orientation 5-8) are transposed after
+        # loading, so reduce them against the swapped target
+        orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+        if orientation in (5, 6, 7, 8):
+            target_width, target_height = target_height, target_width
+            native_size = native_size[::-1]
+
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (shrink-on-load).
+        # Request 2x the target so the final resize keeps its quality.
+        if img.format == 'JPEG':
+            img.draft('RGB', (target_width * 2, target_height * 2))
+
+        # For large downscales (4x or more), pre-shrink with a cheap box filter
+        # to about 2x the target so rotation and the final filter pass touch
+        # fewer pixels. Below that the integer factor would be 1, a plain copy.
+        scale = max(img.width / target_width, img.height / target_height)
+        factor = int(scale // 2)
+        if factor > 1:
+            img = img.resize(
+                (img.width // factor, img.height // factor),
+                Image.Resampling.BOX
+            )
+
+        img.load()
+
+        # Show the image upright according to its EXIF orientation
+        # (exif_transpose copies the image even when there is nothing to do)
+        if orientation != 1:
+            img = ImageOps.exif_transpose(img)
+
+        if keep_source:
+            with self.source_lock:
+                # Only the displayed image's source is kept
+                self.source_cache.clear()
+                self.source_cache[image_path] = (img, native_size)
+
+        return img
 
-            # Schedule next image if auto-play is enabled
-            if self.auto_play and self.delay > 0:
-                self.timer_id = self.root.after(self.delay, self.next_image)
-                
+    def _decode_preview(self, image_path, rotation, window_width, window_height):
+        """
+        Quickly decode a low-res JPEG preview scaled up to fit the window.
+        Runs on the preview thread.
+
+        Args:
+            image_path: Path string of the image to decode
+            rotation: Rotation angle in degrees (clockwise)
+            window_width: Target width in pixels
+            window_height: Target height in pixels
+
+        Returns:
+            Image: PIL image sized to fit the window, or None if not a JPEG
+        """
+        img = Image.open(image_path)
+
+        # Only JPEGs can be decoded cheaply at reduced scale
+        if img.format != 'JPEG':
+            return None
+
+        img.draft('RGB', (window_width // 4, window_height // 4))
+        if img.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+            img = ImageOps.exif_transpose(img)
+
+        if rotation != 0:
+            img = img.rotate(-rotation, expand=True)
+
+        # Scale (usually up) to fit the window with a cheap filter
+        ratio = min(window_width / img.width, window_height / img.height)
+        size = (max(1, round(img.width * ratio)), max(1, round(img.height * ratio)))
+        return img.resize(size, Image.Resampling.BILINEAR)
+
+    def _poll_decode(self, future, generation, preview=None):
+        """
+        Wait for a background decode to finish, then present it on the Tk thread.
+        A preview is shown in the meantime if it finishes first.
+
+        Args:
+            future: Future returned by the decode pool
+            generation: Render generation the decode was requested for
+            preview: Optional future for a low-res preview
+        """
+        # Drop results that a newer display request has superseded
+        if generation != self.render_generation:
+            return
+
+        if not future.done():
+            if preview is not None and preview.done():
+                if preview.exception() is None and preview.result() is not None:
+                    self._present_preview(preview.result())
+                preview = None
+            self.root.after(10, self._poll_decode, future, generation, preview)
+            return
+
+        try:
+            self._present_image(future.result())
         except Exception as e:
-            print(f"Error loading image {image_path}: {e}")
+            self.decode_cache.clear()
+            print(f"Error loading image {self.image_paths[self.current_index]}: {e}")
             # Skip to next image
             self.next_image()
+
+    def _present_preview(self, img):
+        """
+        Show a low-res preview until the full-quality image is ready.
+
+        Args:
+            img: PIL preview image sized for the window
+        """
+        self._show_photo(img)
+        # The screen no longer shows the last full render
+        self.last_render = None
+        self.current_thumb = None
+        self._update_info_label()
+
+    def _present_image(self, img):
+        """
+        Show a decoded image and schedule the next one.
+
+        Args:
+            img: PIL image already resized for the window
+        """
+        self._show_photo(img)
+        self.last_render = self.pending_render
+        self.current_thumb = img
+
+        # Once fullscreen has reached the screen width the size is fixed:
+        # stop querying it and stop handling resize events
+        if (self.fullscreen and self.fixed_size is None
+                and self.display_size[0] == self.root.winfo_screenwidth()):
+            self.fixed_size = self.display_size
+            self.root.unbind('<Configure>')
+
+        self._update_status()
+
+        # Prefetch the previous image, then the next ones, while this one is on screen.
+        # The previous one goes first so a new image evicts the one two steps back
+        # from the LRU caches, not the image just left.
+        if self.current_index > 0 or self.scan_complete.is_set():
+            previous_index = (self.current_index - 1) % len(self.image_paths)
+            self._request_decode(previous_index, 0, *self.display_size)
+        for offset in range(1, self.prefetch_count + 1):
+            next_index = self.current_index + offset
+            if next_index >= len(self.image_paths):
+                # Don't wrap around to the start until the scan has found the end
+                if not self.scan_complete.is_set():
+                    break
+                next_index %= len(self.image_paths)
+            self._request_decode(next_index, 0, *self.display_size)
+
+    def _show_photo(self, img):
+        """
+        Draw an image centred on black into the persistent PhotoImage.
+        The PhotoImage is only recreated when the window size changes.
+
+        Args:
+            img: PIL image that fits within the display size
+        """
+        width, height = self.display_size
+
+        if self.photo is None or (self.photo.width(), self.photo.height()) != (width, height):
+            self.photo = ImageTk.PhotoImage('RGB', (width, height))
+            self.image_label.config(image=self.photo)
+
+        # Composite transparent images over the black background
+        mask = None
+        if 'A' in img.getbands() or 'transparency' in img.info:
+            img = img.convert('RGBA')
+            mask = img
+
+        frame = Image.new('RGB', (width, height), 'black')
+        frame.paste(img, ((width - img.width) // 2, (height - img.height) // 2), mask)
+        self.photo.paste(frame)
+
+    def _update_status(self):
+        """Update the info label and schedule the next image if auto-play is enabled"""
+        self._update_info_label()
+
+        # Schedule next image if auto-play is enabled
+        if self.auto_play and self.delay > 0:
+            remaining_ms = max(1, int((self.next_deadline - time.monotonic()) * 1000))
+            self.timer_id = self.root.after(remaining_ms, self.next_image)
     
-    def next_image(self):
+    def _update_info_label(self):
+        """Show auto-play status, position and path of the current image"""
+        relative_path = self.relative_paths[self.current_index]
+        delay_seconds = self.delay // 1000
+        status = f"▶ AUTO ({delay_seconds}s)" if self.auto_play else f"⏸ MANUAL ({delay_seconds}s)"
+        self.info_label.config(
+            text=f"{status} | {self.current_index + 1}/{len(self.image_paths)} | {relative_path}"
+        )
+
+        # Force GUI update
+        self.root.update_idletasks()
+
+    def next_image(self, event=None):
         """Show next image"""
-        self.current_index = (self.current_index + 1) % len(self.image_paths)
+        next_index = self.current_index + 1
+        if next_index >= len(self.image_paths):
+            if not self.scan_complete.is_set():
+                # Next image not found yet; retry shortly when auto-playing
+                if self.auto_play and self.delay > 0:
+                    self.timer_id = self.root.after(100, self.next_image)
+                return
+            next_index = 0
+        self.current_index = next_index
         self.current_rotation = 0  # Reset rotation for new image
         self.display_image()
 
-    def previous_image(self):
+    def previous_image(self, event=None):
         """Show previous image"""
+        # Don't wrap around to the end until the scan has found it
+        if self.current_index == 0 and not self.scan_complete.is_set():
+            return
         self.current_index = (self.current_index - 1) % len(self.image_paths)
         self.current_rotation = 0  # Reset rotation for new image
         self.display_image()
@@ -414,30 +1200,27 @@ class ImageSlideshow:
                 self.root.after_cancel(self.timer_id)
                 self.timer_id = None
             # Update status bar
-            relative_path = self.image_paths[self.current_index].relative_to(self.root_dir)
+            relative_path = self.relative_paths[self.current_index]
             delay_seconds = self.delay // 1000
             self.info_label.config(
                 text=f"⏸ MANUAL ({delay_seconds}s) | {self.current_index + 1}/{len(self.image_paths)} | {relative_path}"
             )
 
-    def get_resume_index(self, state):
+    def get_resume_index(self):
         """
         Determine the starting index from saved state.
 
-        Args:
-            state: Loaded state dictionary
-
         Returns:
             int: Index to start from (0 if no valid state found)
         """
         # Get normalized directory key
-        dir_key = normalize_directory_path(self.root_dir)
+        dir_key = self.dir_key
 
         # Check if directory exists in state
-        if dir_key not in state.get('directories', {}):
+        if dir_key not in self.state.get('directories', {}):
             return 0
 
-        dir_state = state['directories'][dir_key]
+        dir_state = self.state['directories'][dir_key]
 
         # Strategy 1: Try to find by relative path (most robust)
         saved_path = dir_state.get('last_image_path')
@@ -445,12 +1228,12 @@ class ImageSlideshow:
 
         if saved_path:
             try:
-                full_path = self.root_dir / saved_path
-
-                if full_path in self.image_paths:
-                    return self.image_paths.index(full_path)
+                path_index = self.relative_index.get(saved_path)
+                if path_index is not None:
+                    return path_index
                 else:
                     # Check if image was filtered by ignore list
+                    full_path = self.root_dir / saved_path
                     if full_path.exists() and not self.disable_ignore:
                         # Image exists but not in list - likely filtered
                         saved_image_filtered = True
@@ -458,8 +1241,9 @@ class ImageSlideshow:
                 pass  # Path not found, try index
 
         # Strategy 2: Use saved index only if total image count hasn't changed
-        # (if count changed, filtering likely changed, so index is unreliable)
-        saved_total = dir_state.get('total_images', 0)
+        # (if count changed, filtering likely changed, so index is unreliable).
+        # The count is missing if the app quit before its first scan finished.
+        saved_total = dir_state.get('total_images')
         current_total = len(self.image_paths)
 
         if saved_total == current_total:
@@ -470,7 +1254,7 @@ class ImageSlideshow:
         # Strategy 3: Default to beginning if image count changed or index invalid
         if saved_image_filtered:
             print(f"Note: Last viewed image was in an ignored folder, starting from beginning")
-        elif saved_total != current_total:
+        elif saved_total is not None and saved_total != current_total:
             print(f"Note: Image count changed from {saved_total} to {current_total}, starting from beginning")
 
         return 0
@@ -480,28 +1264,34 @@ class ImageSlideshow:
         Save the current slideshow position to state file.
         Called from quit() method.
         """
-        # Load existing state
-        state = load_state()
-
         # Normalize directory path
-        dir_key = normalize_directory_path(self.root_dir)
+        dir_key = self.dir_key
 
-        # Compute relative path from current image
-        current_image = self.image_paths[self.current_index]
-        relative_path = str(current_image.relative_to(self.root_dir))
+        # Relative path of current image
+        relative_path = self.relative_paths[self.current_index]
 
-        # Update state for this directory
-        state['directories'][dir_key] = {
+        # Update state for this directory (loaded at startup)
+        dir_state = {
             'last_image_path': relative_path,
-            'last_index': self.current_index,
-            'total_images': len(self.image_paths),
-            'last_updated': datetime.now().isoformat()
+            'last_index': self.current_index
         }
 
+        # A scan still running only knows part of the images; keep the last
+        # complete count rather than saving one that won't match next time
+        if self.scan_complete.is_set():
+            dir_state['total_images'] = len(self.image_paths)
+        else:
+            previous_total = self.state['directories'].get(dir_key, {}).get('total_images')
+            if previous_total is not None:
+                dir_state['total_images'] = previous_total
+
+        dir_state['last_updated'] = int(time.time())  # Unix timestamp
+        self.state['directories'][dir_key] = dir_state
+
         # Save updated state
-        save_state(state)
+        save_state(self.state)
 
-    def toggle_auto_play(self):
+    def toggle_auto_play(self, event=None):
         """Toggle auto-play mode"""
         self.auto_play = not self.auto_play
         if self.auto_play and self.delay > 0:
@@ -511,16 +1301,21 @@ class ImageSlideshow:
                 self.root.after_cancel(self.timer_id)
                 self.timer_id = None
             # Update info label
-            relative_path = self.image_paths[self.current_index].relative_to(self.root_dir)
+            relative_path = self.relative_paths[self.current_index]
             delay_seconds = self.delay // 1000
             self.info_label.config(
                 text=f"⏸ MANUAL ({delay_seconds}s) | {self.current_index + 1}/{len(self.image_paths)} | {relative_path}"
             )
     
-    def toggle_fullscreen(self):
+    def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
         self.fullscreen = not self.fullscreen
         self.root.attributes('-fullscreen', self.fullscreen)
+
+        # Leaving fullscreen: the window can be resized again
+        if not self.fullscreen and self.fixed_size is not None:
+            self.fixed_size = None
+            self.root.bind('<Configure>', self.on_resize)
     
     def on_resize(self, event):
         """Handle window resize"""
@@ -528,30 +1323,57 @@ class ImageSlideshow:
         if event.widget != self.image_label:
             return
 
+        # Ignore Configure events that don't change the size (moves, repacks)
+        size = (event.width, event.height)
+        if size == self.last_size:
+            return
+        self.last_size = size
+
         # Cancel pending resize timer
         if self.resize_timer_id:
             self.root.after_cancel(self.resize_timer_id)
+            self.resize_timer_id = None
+
+        # Back at the size already on screen (e.g. a drag that returned)
+        if size == self.display_size:
+            return
 
         # Schedule redisplay after a short delay (debounce)
         if hasattr(self, 'image_paths') and self.image_paths:
-            self.resize_timer_id = self.root.after(100, self.display_image)
+            self.resize_timer_id = self.root.after(250, self.display_image)
     
-    def quit(self):
+    def on_key(self, event):
+        """Handle rotation and delay keys"""
+        key = event.keysym
+        if key == 'comma':
+            self.rotate_image(-90)  # Counter-clockwise
+        elif key == 'period':
+            self.rotate_image(90)   # Clockwise
+        elif len(key) == 1 and key.isdigit():
+            self.set_delay(int(key))
+
+    def quit(self, event=None):
         """Quit the application and save state"""
         self.save_current_state()
+        self.scan_stop.set()
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
         if self.resize_timer_id:
             self.root.after_cancel(self.resize_timer_id)
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+        self.preview_pool.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
         self.root.destroy()
 
-    def quit_without_saving(self):
+    def quit_without_saving(self, event=None):
         """Quit the application without saving state"""
+        self.scan_stop.set()
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
         if self.resize_timer_id:
             self.root.after_cancel(self.resize_timer_id)
+        self.decode_pool.shutdown(wait=False, cancel_futures=True)
+        self.preview_pool.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
         self.root.destroy()
 
@@ -572,6 +1394,8 @@ class ImageSlideshow:
         self.root.focus_force()
         # Schedule first image display after mainloop starts
         self.root.after(100, self.display_image)
+        if self.cached_image_list:
+            self.root.after(500, self.check_rescan)
         self.root.mainloop()
 
 
@@ -596,6 +1420,8 @@ Examples:
   %(prog)s /path/to/photos --continue  (resume from last position)
   %(prog)s /path/to/photos --start-index 42  (start at image 42)
   %(prog)s /path/to/photos --no-ignore  (disable folder filtering)
+  %(prog)s /path/to/photos --filter lanczos  (highest quality resizing)
+  %(prog)s /path/to/photos --quality fast  (fastest resizing)
   %(prog)s . --delay 0  (manual mode, current directory)
         """
     )
@@ -640,6 +1466,22 @@ Examples:
         help='Start slideshow at specific image index (0-based, overrides --continue)'
     )
 
+    resample_group = parser.add_mutually_exclusive_group()
+
+    resample_group.add_argument(
+        '--filter',
+        choices=list(RESAMPLE_FILTERS),
+        default='bicubic',
+        help='Resampling filter for resizing images (default: bicubic)'
+    )
+
+    resample_group.add_argument(
+        '--quality',
+        choices=list(QUALITY_FILTERS),
+        default=None,
+        help='Resizing preset: fast (bilinear) or high (lanczos), instead of --filter'
+    )
+
     args = parser.parse_args()
     
     # Validate directory
@@ -650,6 +1492,9 @@ Examples:
     # Convert delay to milliseconds
     delay_ms = args.delay * 1000
 
+    # A --quality preset picks the filter
+    resample_filter = QUALITY_FILTERS[args.quality] if args.quality else args.filter
+
     # Create and run slideshow
     slideshow = ImageSlideshow(
         args.directory,
@@ -657,7 +1502,8 @@ Examples:
         delay_ms,
         resume=args.resume,
         disable_ignore=args.no_ignore,
-        start_index=args.start_index
+        start_index=args.start_index,
+        resample_filter=resample_filter
     )
     slideshow.run()
 